@@ -27,7 +27,10 @@ def main(argv: Sequence[str] | None = None) -> None:
     args = parse_args(argv)
     config = PipelineConfig.from_yaml(args.config)
     orchestrator = NewsPipelineOrchestrator(config)
-    results = orchestrator.run()
+    try:
+        results = orchestrator.run()
+    finally:
+        orchestrator.close()
 
     output_path = config.output.path
     if results:
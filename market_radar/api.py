@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures as futures
+import copy
+import dataclasses
+import functools
+import hashlib
+import multiprocessing
 import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
+import orjson
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 
 from .config import PipelineConfig
 from .orchestrator import NewsPipelineOrchestrator
@@ -16,9 +27,16 @@ from .orchestrator import NewsPipelineOrchestrator
 DEFAULT_CONFIG_ENV = "MARKET_RADAR_CONFIG"
 DEFAULT_CONFIG_FALLBACK = "config.example.yaml"
 MODEL_CACHE_ENV = "MARKET_RADAR_MODEL_CACHE"
+WORKERS_ENV = "MARKET_RADAR_WORKERS"
+
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
 
 _DEFAULT_CONFIG_PATH: Path | None = None
 
+_ORCHESTRATOR_CACHE_SIZE = 4
+_ORCHESTRATORS: "OrderedDict[str, Tuple[NewsPipelineOrchestrator, threading.Lock]]" = OrderedDict()
+_ORCHESTRATORS_LOCK = threading.Lock()
+
 
 def configure_default_config_path(path: Path | str) -> None:
     """Set the default configuration file path used by the API factory."""
@@ -31,6 +49,26 @@ def create_app(config_path: Path | str | None = None) -> FastAPI:
     """Create and configure the FastAPI application."""
 
     default_config_path = _determine_config_path(config_path)
+    workers = _workers_from_env()
+    pool: Optional[futures.ProcessPoolExecutor] = None
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        nonlocal pool
+        if workers > 0:
+            # Spawned workers keep their own orchestrator cache, so each loads the
+            # models once and runs CPU-bound stages outside this process's GIL.
+            pool = futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        try:
+            yield
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+                pool = None
+            await run_in_threadpool(_close_orchestrators)
 
     app = FastAPI(
         title="Market Radar API",
@@ -39,13 +77,23 @@ def create_app(config_path: Path | str | None = None) -> FastAPI:
             "HTTP wrapper for the Market Radar pipeline. Runtime overrides are limited "
             "to the 'since' window while responses return the generated JSON file."
         ),
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
-    @app.get("/healthz", summary="Health check")
-    async def health_check() -> dict[str, str]:
+    inflight: Dict[Tuple[Optional[str], Optional[int]], "asyncio.Future[Path]"] = {}
+
+    async def _dispatch(since: Optional[str]) -> Path:
+        if pool is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, _execute_pipeline, default_config_path, since)
+        return await run_in_threadpool(_execute_pipeline, default_config_path, since)
+
+    @app.get("/healthz", summary="Health check", response_class=Response)
+    async def health_check() -> Response:
         """Return a simple health indicator."""
 
-        return {"status": "ok"}
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     @app.post(
         "/pipeline",
@@ -60,12 +108,18 @@ def create_app(config_path: Path | str | None = None) -> FastAPI:
     ) -> FileResponse:
         """Execute the pipeline with optional overrides and return the output file."""
 
+        # Identical concurrent requests share one run; the config mtime is part of
+        # the key so an edited file is never answered from a stale run.
+        key = (since, _config_mtime_ns(default_config_path))
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_dispatch(since))
+            inflight[key] = task
+            task.add_done_callback(lambda _, key=key: inflight.pop(key, None))
+
         try:
-            response = await run_in_threadpool(
-                _execute_pipeline,
-                default_config_path,
-                since,
-            )
+            # Shielded so one client disconnecting does not cancel the shared run.
+            response = await asyncio.shield(task)
         except FileNotFoundError as exc:  # pragma: no cover - simple mapping
             raise HTTPException(status_code=404, detail=str(exc)) from exc
         except ValueError as exc:  # pragma: no cover - validation mapping
@@ -101,12 +155,58 @@ def _execute_pipeline(
         cache_dir.mkdir(parents=True, exist_ok=True)
         config.density.model_cache_dir = cache_dir
 
-    orchestrator = NewsPipelineOrchestrator(config)
-    orchestrator.run()
+    orchestrator, run_lock = _get_orchestrator(config)
+    with run_lock:
+        orchestrator.config.time_window.since = config.time_window.since
+        orchestrator.config.output.path = config.output.path
+        orchestrator.run()
 
     return config.output.path
 
 
+def _orchestrator_key(config: PipelineConfig) -> str:
+    """Hash the configuration without the per-request overrides."""
+
+    stable = dataclasses.replace(
+        config,
+        time_window=dataclasses.replace(config.time_window, since=""),
+        output=dataclasses.replace(config.output, path=Path()),
+    )
+    return hashlib.blake2b(repr(stable).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_orchestrator(config: PipelineConfig) -> Tuple[NewsPipelineOrchestrator, threading.Lock]:
+    """Return a cached orchestrator so loaded models stay resident between requests."""
+
+    key = _orchestrator_key(config)
+    evicted: List[Tuple[NewsPipelineOrchestrator, threading.Lock]] = []
+    with _ORCHESTRATORS_LOCK:
+        entry = _ORCHESTRATORS.get(key)
+        if entry is None:
+            entry = (NewsPipelineOrchestrator(config), threading.Lock())
+            _ORCHESTRATORS[key] = entry
+            while len(_ORCHESTRATORS) > _ORCHESTRATOR_CACHE_SIZE:
+                evicted.append(_ORCHESTRATORS.popitem(last=False)[1])
+        else:
+            _ORCHESTRATORS.move_to_end(key)
+    for orchestrator, run_lock in evicted:
+        # Wait for any run still using the evicted orchestrator before stopping its workers.
+        with run_lock:
+            orchestrator.close()
+    return entry
+
+
+def _close_orchestrators() -> None:
+    """Stop the worker processes of every cached orchestrator."""
+
+    with _ORCHESTRATORS_LOCK:
+        entries = list(_ORCHESTRATORS.values())
+        _ORCHESTRATORS.clear()
+    for orchestrator, run_lock in entries:
+        with run_lock:
+            orchestrator.close()
+
+
 def _determine_config_path(config_path: Path | str | None) -> Path:
     """Resolve the configuration path from CLI, module, or environment."""
 
@@ -130,7 +230,38 @@ def _load_config(default_config_path: Path) -> PipelineConfig:
     """Load configuration from the default path defined at application startup."""
 
     config_path = _validate_path(default_config_path, "configuration file")
-    return PipelineConfig.from_yaml(config_path)
+    mtime_ns = config_path.stat().st_mtime_ns
+    # Requests mutate their config with overrides, so hand out a private copy.
+    return copy.deepcopy(_parsed_config(str(config_path), mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _parsed_config(path: str, mtime_ns: int) -> PipelineConfig:
+    """Parse a configuration file once per path and modification time."""
+
+    return PipelineConfig.from_yaml(Path(path))
+
+
+def _workers_from_env() -> int:
+    """Read the worker process count, failing with a clear message on bad values."""
+
+    raw = os.getenv(WORKERS_ENV, "").strip()
+    if not raw:
+        return 0
+    try:
+        workers = int(raw)
+    except ValueError:
+        raise ValueError(f"{WORKERS_ENV} must be a non-negative integer, got {raw!r}") from None
+    if workers < 0:
+        raise ValueError(f"{WORKERS_ENV} must be a non-negative integer, got {raw!r}")
+    return workers
+
+
+def _config_mtime_ns(default_config_path: Path) -> Optional[int]:
+    try:
+        return _normalise_path(str(default_config_path)).stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def _resolve_output_path(config: PipelineConfig, default_config_path: Path) -> Path:
@@ -138,21 +269,34 @@ def _resolve_output_path(config: PipelineConfig, default_config_path: Path) -> P
 
     output_path = config.output.path
     if not output_path.is_absolute():
-        output_path = (default_config_path.parent / output_path).resolve()
+        output_path = _resolve_cached(str(default_config_path.parent / output_path))
     return output_path
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(path_str: str) -> Path:
+    return Path(path_str).resolve()
+
+
 def _validate_path(path_input: Path | str, label: str, *, must_exist: bool = True) -> Path:
     """Validate and normalise file paths coming from the request."""
 
-    path = Path(path_input).expanduser()
-    if not path.is_absolute():
-        path = path.resolve()
+    path = _normalise_path(str(path_input))
     if must_exist and not path.exists():
         raise FileNotFoundError(f"{label.capitalize()} not found: {path}")
     return path
 
 
+@functools.lru_cache(maxsize=256)
+def _normalise_path(path_str: str) -> Path:
+    """Expand and resolve a path once; existence is still checked per request."""
+
+    path = Path(path_str).expanduser()
+    if not path.is_absolute():
+        path = path.resolve()
+    return path
+
+
 def _ensure_parent(path: Path) -> Path:
     """Ensure the parent directory exists before writing output files."""
 
@@ -0,0 +1,154 @@
+"""Persistent cache of extracted articles and feed state for the Market Radar fetcher."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import orjson
+
+from .models import Article
+
+_LOOKUP_CHUNK = 500
+
+
+@dataclass
+class FeedState:
+    """Validators and links remembered from the last successful feed download."""
+
+    etag: Optional[str]
+    modified: Optional[str]
+    entries: List[Tuple[str, Optional[datetime]]]
+
+
+class ArticleCache:
+    """Store extracted articles and feed validators in SQLite."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles(url TEXT PRIMARY KEY, crawled_at INTEGER, payload BLOB)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS feeds(url TEXT PRIMARY KEY, etag TEXT, modified TEXT, entries BLOB)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _dump(article: Article) -> bytes:
+        return orjson.dumps(
+            {
+                "source_domain": article.source_domain,
+                "title": article.title,
+                "content": article.content,
+                "published_at": article.published_at,
+                "crawled_at": article.crawled_at,
+                "language": article.language,
+                "authors": article.authors,
+                "extras": article.extras,
+            }
+        )
+
+    @staticmethod
+    def _load(source_id: str, url: str, payload: bytes) -> Article:
+        data = orjson.loads(payload)
+        published = data.get("published_at")
+        return Article(
+            source_id=source_id,
+            source_domain=data.get("source_domain", ""),
+            url=url,
+            title=data.get("title"),
+            content=data.get("content"),
+            published_at=datetime.fromisoformat(published) if published else None,
+            crawled_at=datetime.fromisoformat(data["crawled_at"]),
+            language=data.get("language"),
+            authors=data.get("authors"),
+            extras=data.get("extras") or {},
+        )
+
+    def get_many(self, tasks: Dict[str, str], newer_than: datetime) -> Dict[str, Article]:
+        """Return cached articles crawled after ``newer_than`` for the given URL→source map."""
+
+        urls = list(tasks)
+        threshold = int(newer_than.timestamp())
+        found: Dict[str, Article] = {}
+        with self._connect() as conn:
+            for start in range(0, len(urls), _LOOKUP_CHUNK):
+                chunk = urls[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT url, payload FROM articles WHERE url IN ({placeholders}) AND crawled_at >= ?",
+                    (*chunk, threshold),
+                )
+                for url, payload in rows:
+                    try:
+                        found[url] = self._load(tasks[url], url, payload)
+                    except (ValueError, KeyError):
+                        continue
+        return found
+
+    def put_many(self, articles: Sequence[Article]) -> None:
+        """Persist freshly extracted articles."""
+
+        rows = [
+            (article.url, int(article.crawled_at.timestamp()), self._dump(article))
+            for article in articles
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO articles(url, crawled_at, payload) VALUES (?, ?, ?)", rows
+            )
+
+    def get_feeds(self, urls: Sequence[str]) -> Dict[str, FeedState]:
+        """Return the stored state of the given feed URLs."""
+
+        urls = list(urls)
+        found: Dict[str, FeedState] = {}
+        with self._connect() as conn:
+            for start in range(0, len(urls), _LOOKUP_CHUNK):
+                chunk = urls[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT url, etag, modified, entries FROM feeds WHERE url IN ({placeholders})",
+                    chunk,
+                )
+                for url, etag, modified, entries in rows:
+                    try:
+                        links = [
+                            (link, datetime.fromisoformat(dt) if dt else None)
+                            for link, dt in orjson.loads(entries)
+                        ]
+                    except (TypeError, ValueError):
+                        continue
+                    found[url] = FeedState(etag=etag, modified=modified, entries=links)
+        return found
+
+    def put_feeds(self, states: Dict[str, FeedState]) -> None:
+        """Persist feed validators together with the links they cover."""
+
+        rows = [
+            (url, state.etag, state.modified, orjson.dumps(state.entries))
+            for url, state in states.items()
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO feeds(url, etag, modified, entries) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+
+__all__ = ["ArticleCache", "FeedState"]
@@ -8,6 +8,11 @@ from typing import Any, Dict, Optional
 
 import yaml
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class TimeWindowConfig:
@@ -28,6 +33,10 @@ class FetcherConfig:
     timeout: int = 30
     user_agent: str = "market-radar/1.0"
     feed_retries: int = 2
+    head_check: bool = False
+    max_page_bytes: int = 5_000_000
+    cache_path: Optional[Path] = None
+    cache_max_age: str = "24h"
 
 
 @dataclass
@@ -40,6 +49,10 @@ class DensityConfig:
     content_score: float = 0.3
     content_chars: int = 300
     batch_size: int = 64
+    precision: str = "auto"
+    backend: str = "torch"
+    encode_processes: int = 1
+    embedding_cache: bool = True
     window_hours: int = 24
     deduplicate: bool = True
     deduplication_threshold: float = 0.92
@@ -54,6 +67,12 @@ class SummarizerConfig:
     timeout: int = 60
     api_key: Optional[str] = None
     fallback_summary: bool = True
+    concurrency: int = 8
+    batch_size: int = 1
+    cache_path: Optional[Path] = None
+    cache_flush_every: int = 16
+    stream: bool = False
+    rpm: Optional[int] = None
 
 
 @dataclass
@@ -78,6 +97,7 @@ class OutputConfig:
     """Configuration for pipeline output."""
 
     path: Path
+    limit: Optional[int] = None
 
 
 @dataclass
@@ -100,6 +120,8 @@ class PipelineConfig:
         fetcher_cfg_raw = {**data.get("fetcher", {})}
         if "sources_path" in fetcher_cfg_raw:
             fetcher_cfg_raw["sources_path"] = Path(fetcher_cfg_raw["sources_path"])
+        if fetcher_cfg_raw.get("cache_path"):
+            fetcher_cfg_raw["cache_path"] = Path(fetcher_cfg_raw["cache_path"])
         fetcher = FetcherConfig(**fetcher_cfg_raw)
 
         density_cfg_raw = {**data.get("density", {})}
@@ -108,6 +130,11 @@ class PipelineConfig:
         density = DensityConfig(**density_cfg_raw)
 
         summarizer_cfg_raw = {**data.get("summarizer", {})}
+        if summarizer_cfg_raw.get("cache_path"):
+            summarizer_cfg_raw["cache_path"] = Path(summarizer_cfg_raw["cache_path"])
+        rpm = summarizer_cfg_raw.get("rpm")
+        if rpm is not None and (isinstance(rpm, bool) or not isinstance(rpm, int) or rpm < 1):
+            raise ValueError(f"summarizer.rpm must be a positive integer or null, got {rpm!r}")
         summarizer = SummarizerConfig(**summarizer_cfg_raw)
 
         hotness_raw = {**data.get("hotness", {})}
@@ -118,6 +145,9 @@ class PipelineConfig:
 
         output_cfg_raw = {**data.get("output", {})}
         output_cfg_raw["path"] = Path(output_cfg_raw["path"])
+        limit = output_cfg_raw.get("limit")
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 1):
+            raise ValueError(f"output.limit must be a positive integer or null, got {limit!r}")
         output = OutputConfig(**output_cfg_raw)
 
         return cls(
@@ -133,7 +163,13 @@ class PipelineConfig:
     def from_yaml(cls, path: Path) -> "PipelineConfig":
         """Load configuration from a YAML file."""
 
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        return cls.from_yaml_bytes(path.read_bytes())
+
+    @classmethod
+    def from_yaml_bytes(cls, content: bytes) -> "PipelineConfig":
+        """Load configuration from raw YAML bytes without decoding them first."""
+
+        data = yaml.load(content, Loader=_YamlLoader)
         if not isinstance(data, dict):
             raise ValueError("YAML config must contain a mapping at the root")
         return cls.from_dict(data)
@@ -142,7 +178,7 @@ class PipelineConfig:
     def from_yaml_string(cls, content: str) -> "PipelineConfig":
         """Load configuration from a raw YAML string."""
 
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_YamlLoader)
         if not isinstance(data, dict):
             raise ValueError("YAML config must contain a mapping at the root")
         return cls.from_dict(data)
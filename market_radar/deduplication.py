@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 import numpy as np
 
@@ -28,33 +28,32 @@ class Deduplicator:
         self.settings = settings
 
     @staticmethod
-    def _normalize(values: List[float]) -> List[float]:
-        if not values:
+    def _normalize(values: np.ndarray) -> List[float]:
+        if not len(values):
             return []
-        lo = min(values)
-        hi = max(values)
+        lo = values.min()
+        hi = values.max()
         if hi > lo:
-            return [(val - lo) / (hi - lo) for val in values]
-        return [1.0 if val > 0 else 0.0 for val in values]
+            return ((values - lo) / (hi - lo)).tolist()
+        return (values > 0).astype(np.float64).tolist()
 
     def apply(
         self,
         articles: Sequence[Article],
-        density_scores: Dict[int, float],
+        density_scores: np.ndarray,
         title_embeddings: Optional[np.ndarray],
         stage: Optional["StageHandle"] = None,
     ) -> Tuple[List[Article], List[float]]:
         if not articles:
             return [], []
 
+        density_scores = np.asarray(density_scores, dtype=np.float64)
         if not self.settings.enabled or title_embeddings is None:
             if stage is not None:
                 stage.set_total(len(articles))
                 if len(articles):
                     stage.advance(len(articles))
-            ordered = list(range(len(articles)))
-            coefs = [density_scores.get(idx, 0.0) for idx in ordered]
-            return list(articles), self._normalize(coefs)
+            return list(articles), self._normalize(density_scores)
 
         n = len(articles)
         if stage is not None:
@@ -62,9 +61,10 @@ class Deduplicator:
 
         keep_mask = np.zeros(n, dtype=bool)
         removed = np.zeros(n, dtype=bool)
-        order = sorted(range(n), key=lambda idx: density_scores.get(idx, 0.0), reverse=True)
+        # Stable descending order, matching sorted(..., reverse=True) on ties.
+        order = np.argsort(-density_scores, kind="stable")
 
-        for position, idx in enumerate(order):
+        for idx in order.tolist():
             if stage is not None:
                 stage.advance(1)
             if removed[idx]:
@@ -79,14 +79,12 @@ class Deduplicator:
                     continue
                 removed[dup_idx] = True
 
-        keep_indices = [idx for idx, keep in enumerate(keep_mask) if keep]
-        if not keep_indices:
+        keep_indices = np.flatnonzero(keep_mask)
+        if not len(keep_indices):
             return [], []
 
-        keep_indices.sort()
-        coefs = [density_scores.get(idx, 0.0) for idx in keep_indices]
-        normalized = self._normalize(coefs)
-        deduped_articles = [articles[idx] for idx in keep_indices]
+        normalized = self._normalize(density_scores[keep_indices])
+        deduped_articles = [articles[idx] for idx in keep_indices.tolist()]
         return deduped_articles, normalized
 
 
@@ -2,43 +2,44 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import re
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 import numpy as np
 
 from .config import DensityConfig
+from .embedding_cache import EmbeddingCache
 from .models import Article
 
 if TYPE_CHECKING:
     from .progress import StageHandle
 
 
+_CLEAN_RE = re.compile(r"(?:<[^>]+>|\s)+")
+_SENT_END_RE = re.compile(r"[.!?](?=\s)")
+
+
 def clean_text(text: Optional[str]) -> str:
     if not text:
         return ""
-    import re
-
-    strip_tags = re.compile(r"<[^>]+>")
-    ws_re = re.compile(r"\s+")
-    text = strip_tags.sub(" ", text)
-    text = ws_re.sub(" ", text).strip()
-    return text
+    return _CLEAN_RE.sub(" ", text).strip()
 
 
 def lead(text: Optional[str], max_chars: int) -> str:
     if not text:
         return ""
+    # Clean before slicing: a cut inside a tag would leave markup the regex cannot strip.
     text = clean_text(text)
     if not text:
         return ""
-    import re
-
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    head = " ".join(parts[:2])
-    if len(head) > max_chars:
-        head = head[:max_chars]
-    return head
+    # Keep up to the end of the second sentence, scanning no further than max_chars.
+    window = text[: max_chars + 1]
+    for count, match in enumerate(_SENT_END_RE.finditer(window), start=1):
+        if count == 2:
+            return window[: match.end()]
+    return text[:max_chars]
 
 
 def has_cuda() -> bool:
@@ -50,20 +51,135 @@ def has_cuda() -> bool:
         return False
 
 
-def get_model(model_id: str, model_cache_dir: Optional[str]):
+PRECISIONS = ("auto", "fp32")
+BACKENDS = ("torch", "onnx", "openvino")
+
+
+def apply_precision(model, device: str, precision: str):
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unsupported density precision: {precision}")
+    if precision == "fp32":
+        return model
+    import torch
+
+    if device == "cuda":
+        return model.half()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def resolved_precision(device: str, precision: str, backend: str) -> str:
+    """Name the numeric format the encoder actually runs in."""
+
+    if backend != "torch":
+        return "native"
+    if precision == "fp32":
+        return "fp32"
+    return "fp16" if device == "cuda" else "int8"
+
+
+def get_model(
+    model_id: str,
+    model_cache_dir: Optional[str],
+    precision: str = "auto",
+    backend: str = "torch",
+):
     from sentence_transformers import SentenceTransformer
 
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported density backend: {backend}")
     device = "cuda" if has_cuda() else "cpu"
+    kwargs = {"device": device}
+    if backend != "torch":
+        kwargs["backend"] = backend
     if model_cache_dir:
-        from pathlib import Path
-
         cache_path = Path(model_cache_dir)
         cache_path.mkdir(parents=True, exist_ok=True)
         local_files = {"config.json", "modules.json", "model.safetensors", "pytorch_model.bin"}
         if any((cache_path / f).exists() for f in local_files) or any(cache_path.glob("**/config.json")):
-            return SentenceTransformer(str(cache_path), device=device)
-        return SentenceTransformer(model_id, cache_folder=str(cache_path), device=device)
-    return SentenceTransformer(model_id, device=device)
+            model = SentenceTransformer(str(cache_path), **kwargs)
+        else:
+            model = SentenceTransformer(model_id, cache_folder=str(cache_path), **kwargs)
+    else:
+        model = SentenceTransformer(model_id, **kwargs)
+    if backend != "torch":
+        # ONNX Runtime and OpenVINO apply their own graph optimisations and precision.
+        return model
+    return apply_precision(model, device, precision)
+
+
+def _unique_texts(texts: Sequence[str]) -> Tuple[List[str], np.ndarray]:
+    # Index 0 is reserved for empty strings, which map onto a zero embedding row.
+    table: Dict[str, int] = {}
+    inverse = np.zeros(len(texts), dtype=np.int64)
+    for pos, text in enumerate(texts):
+        if text:
+            inverse[pos] = table.setdefault(text, len(table) + 1)
+    return list(table), inverse
+
+
+def l2_normalize(values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    np.maximum(norms, 1e-12, out=norms)
+    return np.divide(values, norms, out=out)
+
+
+def encode_devices(processes: int) -> Optional[List[str]]:
+    # One worker per GPU when several are visible, otherwise an optional CPU pool.
+    try:
+        import torch
+
+        gpu_count = torch.cuda.device_count()
+    except Exception:  # pragma: no cover - torch optional
+        gpu_count = 0
+    if gpu_count > 1:
+        return [f"cuda:{idx}" for idx in range(gpu_count)]
+    if processes > 1:
+        return ["cpu"] * processes
+    return None
+
+
+def _encode_sorted(
+    model,
+    texts: Sequence[str],
+    batch_size: int,
+    pool: Optional[Dict[str, object]] = None,
+) -> np.ndarray:
+    # Encode in length order so each mini-batch only pads to its own longest text.
+    order = np.argsort([len(t) for t in texts], kind="stable")
+    ordered = [texts[i] for i in order]
+    if pool is not None:
+        emb = model.encode_multi_process(ordered, pool, batch_size=batch_size)
+        emb = l2_normalize(np.asarray(emb, dtype=np.float32))
+    else:
+        emb = model.encode(
+            ordered,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            normalize_embeddings=True,
+        )
+    inv = np.empty_like(order)
+    inv[order] = np.arange(len(order))
+    # Half-precision models return float16; keep downstream math in float32.
+    return np.asarray(emb, dtype=np.float32)[inv]
+
+
+def _encode_cached(
+    model,
+    texts: Sequence[str],
+    batch_size: int,
+    cache: Optional[EmbeddingCache],
+    pool: Optional[Dict[str, object]] = None,
+) -> np.ndarray:
+    if cache is None:
+        return _encode_sorted(model, texts, batch_size, pool)
+    found = cache.get_many(texts)
+    misses = [text for text in texts if text not in found]
+    if misses:
+        fresh = _encode_sorted(model, misses, batch_size, pool)
+        cache.put_many(misses, fresh)
+        found.update(zip(misses, fresh))
+    return np.stack([found[text] for text in texts])
 
 
 def encode_texts(
@@ -73,86 +189,108 @@ def encode_texts(
     title_score: float,
     content_score: float,
     batch_size: int,
+    cache: Optional[EmbeddingCache] = None,
+    pool: Optional[Dict[str, object]] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     titles_prep = [("passage: " + t) if t else "" for t in titles]
     contents_prep = [("passage: " + c) if c else "" for c in contents]
 
-    e_title = model.encode(
-        titles_prep,
-        batch_size=batch_size,
-        convert_to_numpy=True,
-        show_progress_bar=False,
-        normalize_embeddings=True,
-    )
-    e_content = model.encode(
-        contents_prep,
-        batch_size=batch_size,
-        convert_to_numpy=True,
-        show_progress_bar=False,
-        normalize_embeddings=True,
-    )
+    uniq_texts, inverse = _unique_texts(titles_prep + contents_prep)
+    if uniq_texts:
+        uniq_emb = _encode_cached(model, uniq_texts, batch_size, cache, pool)
+    else:
+        dim = model.get_sentence_embedding_dimension() or 1
+        uniq_emb = np.zeros((0, dim), dtype=np.float32)
+    zero_row = np.zeros((1, uniq_emb.shape[1]), dtype=uniq_emb.dtype)
+    emb = np.vstack([zero_row, uniq_emb])[inverse]
+    e_title = emb[: len(titles_prep)]
+    e_content = emb[len(titles_prep) :]
 
     w_t = np.array([title_score if bool(t) else 0.0 for t in titles], dtype=np.float32)[:, None]
     w_c = np.array([content_score if bool(c) else 0.0 for c in contents], dtype=np.float32)[:, None]
     w_sum = w_t + w_c
     w_sum = np.where(w_sum == 0.0, 1.0, w_sum)
 
-    combined = (w_t * e_title + w_c * e_content) / w_sum
-    norms = np.linalg.norm(combined, axis=1, keepdims=True)
-    norms = np.maximum(norms, 1e-12)
-    return combined / norms, e_title
+    # e_content is a private view into emb, so it can be scaled in place.
+    combined = np.multiply(e_title, w_t / w_sum)
+    combined += np.multiply(e_content, w_c / w_sum, out=e_content)
+    return l2_normalize(combined, out=combined), e_title
 
 
-def bucket_key(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).strftime("%Y-%m-%d")
+@dataclass
+class ArticleColumns:
+    """Column-oriented view of the article fields used for window scoring."""
 
+    source_codes: np.ndarray
+    timestamps: np.ndarray
+
+    @classmethod
+    def from_articles(cls, articles: Sequence[Article]) -> "ArticleColumns":
+        source_ids = [art.source_id for art in articles]
+        timestamps = np.fromiter(
+            (int(art.best_timestamp().timestamp()) for art in articles),
+            dtype=np.int64,
+            count=len(articles),
+        )
+        if source_ids:
+            _, codes = np.unique(np.array(source_ids), return_inverse=True)
+        else:
+            codes = np.zeros(0, dtype=np.int64)
+        return cls(source_codes=codes.astype(np.int64, copy=False), timestamps=timestamps)
 
-def group_by_window(articles: Sequence[Article], window_hours: int) -> Dict[str, List[int]]:
-    groups: Dict[str, List[int]] = {}
-    for idx, art in enumerate(articles):
-        dt = art.best_timestamp()
-        key = bucket_key(dt) if window_hours == 24 else bucket_key(dt)
-        groups.setdefault(key, []).append(idx)
-    return groups
+
+def group_by_window(columns: ArticleColumns, window_hours: int) -> List[List[int]]:
+    if not len(columns.timestamps):
+        return []
+    buckets = columns.timestamps // (max(window_hours, 1) * 3600)
+    order = np.argsort(buckets, kind="stable")
+    split_points = np.flatnonzero(np.diff(buckets[order])) + 1
+    return [group.tolist() for group in np.split(order, split_points)]
+
+
+def _cross_source_similarity_sums(
+    window_emb: np.ndarray,
+    window_codes: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # The sum of similarities to other-source peers is W[i] . (total - own-source total),
+    # which is O(n * d) and never forms the n x n Gram matrix. Self-similarity sits in
+    # the own-source total, so it is excluded automatically.
+    sources, local = np.unique(window_codes, return_inverse=True)
+    # Windows span only a handful of sources, so an S x n one-hot GEMM is far faster
+    # than scattering rows with np.add.at.
+    one_hot = (local[None, :] == np.arange(len(sources))[:, None]).astype(np.float32)
+    per_source = (one_hot @ window_emb).astype(np.float64)
+    others = per_source.sum(axis=0)[None, :] - per_source[local]
+    sim_sums = np.einsum("id,id->i", window_emb, others)
+    counts = len(window_codes) - np.bincount(local, minlength=len(sources))[local]
+    return sim_sums, counts.astype(np.float64)
 
 
 def compute_window_scores(
     idxs: List[int],
-    articles: Sequence[Article],
+    codes: np.ndarray,
     embeddings: np.ndarray,
-) -> Dict[int, float]:
-    if not idxs:
-        return {}
-    window_emb = embeddings[idxs, :]
-    n = window_emb.shape[0]
-    if n == 1:
-        return {idxs[0]: 0.0}
-
-    sim = np.clip(window_emb @ window_emb.T, -1.0, 1.0)
-    dist = 1.0 - sim
-
-    srcs = [articles[i].source_id for i in idxs]
-    srcs_arr = np.array(srcs, dtype=object)
-    same_src = (srcs_arr[:, None] == srcs_arr[None, :])
-    mask = ~same_src
-    np.fill_diagonal(mask, False)
-
-    mean_dist = np.zeros(n, dtype=np.float32)
-    valid = np.zeros(n, dtype=bool)
-    for i in range(n):
-        row_mask = mask[i]
-        vals = dist[i, row_mask]
-        if vals.size > 0:
-            mean_dist[i] = float(vals.mean())
-            valid[i] = True
-        else:
-            mean_dist[i] = np.nan
-            valid[i] = False
+) -> np.ndarray:
+    n = len(idxs)
+    if n <= 1:
+        return np.zeros(n, dtype=np.float64)
+    window_codes = codes[idxs]
+    if np.all(window_codes == window_codes[0]):
+        # No cross-source peers anywhere in the window.
+        return np.zeros(n, dtype=np.float64)
+    if n == 2:
+        # Both articles share the single pair, so min/max normalisation puts them level.
+        return np.ones(n, dtype=np.float64)
+
+    window_emb = np.ascontiguousarray(embeddings[idxs, :], dtype=np.float32)
+    sim_sums, counts = _cross_source_similarity_sums(window_emb, window_codes)
+    valid = counts > 0
+    # mean(1 - sim) over the masked peers equals 1 - mean(sim), so no distance matrix is needed.
+    mean_dist = np.where(valid, 1.0 - sim_sums / np.maximum(counts, 1.0), np.nan)
 
     if np.any(valid):
-        md_valid = mean_dist[valid]
-        lo = float(np.min(md_valid))
-        hi = float(np.max(md_valid))
+        lo = float(np.nanmin(mean_dist))
+        hi = float(np.nanmax(mean_dist))
         if hi > lo:
             norm = (mean_dist - lo) / (hi - lo)
         else:
@@ -160,9 +298,9 @@ def compute_window_scores(
         value = 1.0 - norm
         value = np.where(np.isfinite(value), value, 0.0)
     else:
-        value = np.zeros(n, dtype=np.float32)
+        value = np.zeros(n, dtype=np.float64)
 
-    return {idxs[i]: float(value[i]) for i in range(n)}
+    return value
 
 
 class DensityEstimator:
@@ -171,22 +309,57 @@ class DensityEstimator:
     def __init__(self, config: DensityConfig) -> None:
         self.config = config
         self._model = None
+        self._cache: Optional[EmbeddingCache] = None
+        self._pool: Optional[Dict[str, object]] = None
         self._title_embeddings: Optional[np.ndarray] = None
 
     def _ensure_model(self):
         if self._model is None:
             cache_dir = str(self.config.model_cache_dir) if self.config.model_cache_dir else None
-            self._model = get_model(self.config.model_id, cache_dir)
+            self._model = get_model(
+                self.config.model_id,
+                cache_dir,
+                precision=self.config.precision,
+                backend=self.config.backend,
+            )
         return self._model
 
+    def _ensure_pool(self, model) -> Optional[Dict[str, object]]:
+        # Worker processes each load the model, so start them once and reuse them across runs.
+        if self._pool is None:
+            devices = encode_devices(self.config.encode_processes)
+            if devices:
+                self._pool = model.start_multi_process_pool(target_devices=devices)
+        return self._pool
+
+    def close(self) -> None:
+        """Stop the encoding worker processes, if any were started."""
+
+        if self._pool is not None and self._model is not None:
+            self._model.stop_multi_process_pool(self._pool)
+        self._pool = None
+
+    def _ensure_cache(self) -> Optional[EmbeddingCache]:
+        if self._cache is None and self.config.embedding_cache and self.config.model_cache_dir:
+            # Key on what the encoder really runs as: "auto" means int8 on CPU but fp16 on CUDA.
+            device = "cuda" if has_cuda() else "cpu"
+            precision = resolved_precision(device, self.config.precision, self.config.backend)
+            self._cache = EmbeddingCache(
+                Path(self.config.model_cache_dir) / "embeddings.sqlite3",
+                namespace=f"{self.config.model_id}:{self.config.backend}:{precision}:{device}:f32",
+            )
+        return self._cache
+
     def estimate(
         self,
         articles: Sequence[Article],
         stage: Optional["StageHandle"] = None,
-    ) -> Dict[int, float]:
+    ) -> np.ndarray:
+        """Return one density value per article, aligned with ``articles``."""
+
         if not articles:
             self._title_embeddings = None
-            return {}
+            return np.zeros(0, dtype=np.float64)
 
         model = self._ensure_model()
         titles = [clean_text(art.title) for art in articles]
@@ -199,16 +372,21 @@ class DensityEstimator:
             title_score=self.config.title_score,
             content_score=self.config.content_score,
             batch_size=self.config.batch_size,
+            cache=self._ensure_cache(),
+            pool=self._ensure_pool(model),
         )
         self._title_embeddings = title_embeddings
 
-        groups = group_by_window(articles, self.config.window_hours)
-        values: Dict[int, float] = {}
+        columns = ArticleColumns.from_articles(articles)
+        codes = columns.source_codes
+        windows = group_by_window(columns, self.config.window_hours)
+        values = np.zeros(len(articles), dtype=np.float64)
         if stage is not None:
             stage.set_total(len(articles))
             processed = 0
-        for _, idxs in groups.items():
-            values.update(compute_window_scores(idxs, articles, embeddings))
+
+        for idxs in windows:
+            values[idxs] = compute_window_scores(idxs, codes, embeddings)
             if stage is not None:
                 processed += len(idxs)
                 stage.advance(len(idxs))
@@ -0,0 +1,67 @@
+"""Persistent embedding cache for the Market Radar density estimator."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Sequence
+
+import numpy as np
+
+_LOOKUP_CHUNK = 500
+
+
+class EmbeddingCache:
+    """Store text embeddings in SQLite keyed by a hash of model and text."""
+
+    def __init__(self, path: Path, namespace: str) -> None:
+        self.path = path
+        self.namespace = namespace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS embeddings(key BLOB PRIMARY KEY, vec BLOB)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _key(self, text: str) -> bytes:
+        payload = f"{self.namespace}\0{text}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get_many(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return cached float32 embeddings for the texts that are present."""
+
+        keys = {self._key(text): text for text in texts}
+        found: Dict[str, np.ndarray] = {}
+        key_list = list(keys)
+        with self._connect() as conn:
+            for start in range(0, len(key_list), _LOOKUP_CHUNK):
+                chunk = key_list[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                for key, vec in rows:
+                    found[keys[key]] = np.frombuffer(vec, dtype=np.float32)
+        return found
+
+    def put_many(self, texts: Sequence[str], embeddings: np.ndarray) -> None:
+        """Persist embeddings as float32 rows so cached runs match fresh encodes exactly."""
+
+        rows = [
+            (self._key(text), np.asarray(vec, dtype=np.float32).tobytes())
+            for text, vec in zip(texts, embeddings)
+        ]
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO embeddings(key, vec) VALUES (?, ?)", rows)
+
+
+__all__ = ["EmbeddingCache"]
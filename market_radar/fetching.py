@@ -2,26 +2,123 @@
 
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures as futures
+import functools
+import itertools
 import random
+import re
 import socket
-import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from threading import Lock
-from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
-
+from email.utils import parsedate_to_datetime
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import charset_normalizer
 import feedparser
+import httpx
+import orjson
 import tldextract
 from dateutil import parser as dtparse
 from newsplease import NewsPlease
 
+from .article_cache import ArticleCache, FeedState
 from .config import FetcherConfig, TimeWindowConfig
 from .models import Article
 
 if TYPE_CHECKING:
     from .progress import StageHandle
 
+_SINCE_RE = re.compile(r"(\d+)\s*([^\d\s]+)")
+_SINCE_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+# The bundled public suffix snapshot is enough for registrable domains and
+# avoids network refreshes and on-disk cache writes.
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 10.0
+# A HEAD probe is only an optimisation, so a slow server should not hold it for the full timeout.
+_HEAD_TIMEOUT = 5.0
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _bounded_map(
+    pool: futures.Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    buffersize: int,
+) -> Iterator["futures.Future[R]"]:
+    """Yield completed futures while keeping at most ``buffersize`` tasks in flight."""
+
+    task_iter = iter(items)
+    pending = {pool.submit(fn, item) for item in itertools.islice(task_iter, buffersize)}
+    while pending:
+        done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+        for fut in done:
+            for item in itertools.islice(task_iter, 1):
+                pending.add(pool.submit(fn, item))
+            yield fut
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse a feed date, trying the ISO 8601 and RFC 822 fast paths before dateutil."""
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        pass
+    return dtparse.parse(value)
+
+
+def _canonical_url(url: str) -> str:
+    """Normalise a link so tracking variants of the same article compare equal."""
+
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    ]
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+
+
+def _detect_encoding(content: bytes) -> str:
+    """Guess the charset of pages that do not declare one in their headers."""
+
+    best = charset_normalizer.from_bytes(content).best()
+    return best.encoding if best is not None else "utf-8"
+
+
+@functools.lru_cache(maxsize=4096)
+def _domain_for_host(host: str) -> str:
+    ext = _TLD_EXTRACT(host)
+    return ".".join(part for part in [ext.domain, ext.suffix] if part)
+
+
 @dataclass
 class Source:
     """Representation of a source entry from the sources JSON."""
@@ -43,27 +140,13 @@ class NewsFetcher:
         """Parse a duration string like ``"2h"`` into :class:`timedelta`."""
 
         value = value.strip().lower()
-        number = ""
-        unit = ""
-        for ch in value:
-            if ch.isdigit():
-                number += ch
-            else:
-                unit += ch
-        if not number or not unit:
+        match = _SINCE_RE.fullmatch(value)
+        if not match:
             raise ValueError(f"Invalid time window value: {value}")
-        amount = int(number)
-        unit = unit.strip()
-        mapping = {
-            "s": timedelta(seconds=amount),
-            "m": timedelta(minutes=amount),
-            "h": timedelta(hours=amount),
-            "d": timedelta(days=amount),
-            "w": timedelta(weeks=amount),
-        }
-        if unit not in mapping:
+        amount, unit = int(match.group(1)), match.group(2)
+        if unit not in _SINCE_UNITS:
             raise ValueError(f"Unsupported time unit: {unit}")
-        return mapping[unit]
+        return timedelta(**{_SINCE_UNITS[unit]: amount})
 
     @staticmethod
     def _best_entry_datetime(entry: Dict[str, object]) -> Optional[datetime]:
@@ -72,7 +155,7 @@ class NewsFetcher:
             if not value:
                 continue
             try:
-                dt = dtparse.parse(str(value))
+                dt = _parse_date(str(value))
                 if dt.tzinfo is None:
                     dt = dt.replace(tzinfo=timezone.utc)
                 return dt.astimezone(timezone.utc)
@@ -88,81 +171,192 @@ class NewsFetcher:
                 continue
         return None
 
-    def _collect_feed_urls(
+    @staticmethod
+    def _warn(
+        message: str,
+        exc: Optional[BaseException],
+        log_error: Optional[Callable[[str, Optional[BaseException]], None]],
+    ) -> None:
+        if log_error:
+            log_error(message, exc)
+        else:
+            print(f"[w] {message}")
+
+    async def _fetch_feed(
         self,
+        client: httpx.AsyncClient,
         source_id: str,
-        urls: Sequence[str],
-        since_utc: datetime,
-        request_headers: Optional[Dict[str, str]] = None,
+        feed_url: str,
         retries: int = 2,
         log_error: Optional[Callable[[str, Optional[BaseException]], None]] = None,
-    ) -> List[Tuple[str, Optional[datetime]]]:
-        """Robustly collect links from RSS feeds with retries."""
-
-        collected: List[Tuple[str, Optional[datetime]]] = []
-        headers = request_headers or {}
-        for feed_url in urls:
-            parsed = None
-            last_error: Optional[BaseException] = None
-            for attempt in range(retries + 1):
-                try:
-                    parsed = feedparser.parse(feed_url, request_headers=headers)
-                    break
-                except Exception as exc:  # pragma: no cover - network failure branch
-                    last_error = exc
-                    if attempt < retries:
-                        sleep_s = (1.5 ** attempt) + random.random() * 0.5
-                        time.sleep(sleep_s)
-                    else:
-                        message = (
-                            f"RSS fetch failed after retries | src={source_id} | url={feed_url} | err={exc!r}"
-                        )
-                        if log_error:
-                            log_error(message, exc)
-                        else:
-                            print(f"[w] {message}")
-            if not parsed:
-                continue
+        state: Optional[FeedState] = None,
+    ) -> Optional[FeedState]:
+        """Download and parse a single feed, retrying transient failures.
+
+        When ``state`` carries validators from a previous run the request is
+        conditional, and a ``304 Not Modified`` reply reuses its links.
+        """
+
+        headers: Dict[str, str] = {}
+        if state is not None:
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.modified:
+                headers["If-Modified-Since"] = state.modified
+
+        sleep_s = _BACKOFF_BASE
+        for attempt in range(retries + 1):
+            try:
+                response = await client.get(feed_url, headers=headers)
+            except Exception as exc:  # pragma: no cover - network failure branch
+                if attempt < retries:
+                    # Decorrelated jitter keeps retries of many feeds from synchronising.
+                    sleep_s = min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, sleep_s * 3))
+                    await asyncio.sleep(sleep_s)
+                    continue
+                message = (
+                    f"RSS fetch failed after retries | src={source_id} | url={feed_url} | err={exc!r}"
+                )
+                self._warn(message, exc, log_error)
+                return None
 
-            status = getattr(parsed, "status", None)
-            if status and status != 200:
+            status = response.status_code
+            if status == 304 and state is not None:
+                return state
+            if status != 200:
                 message = (
                     f"non-200 RSS response | src={source_id} | url={feed_url} | status={status}"
                 )
-                if log_error:
-                    log_error(message, last_error)
-                else:
-                    print(f"[w] {message}")
+                self._warn(message, None, log_error)
+            # Only links and dates are read, so skip feedparser's HTML post-processing.
+            # The response headers carry the charset and the base URL for relative links.
+            parsed = feedparser.parse(
+                response.content,
+                resolve_relative_uris=False,
+                sanitize_html=False,
+                response_headers={**response.headers, "content-location": str(response.url)},
+            )
 
             try:
                 entries = getattr(parsed, "entries", []) or []
             except Exception as exc:  # pragma: no cover - defensive
-                if log_error:
-                    log_error(f"bad RSS structure | src={source_id} | url={feed_url}", exc)
-                else:
-                    print(f"[w] bad RSS structure | src={source_id} | url={feed_url}")
+                self._warn(f"bad RSS structure | src={source_id} | url={feed_url}", exc, log_error)
                 entries = []
 
+            links: List[Tuple[str, Optional[datetime]]] = []
             for entry in entries:
-                dt = self._best_entry_datetime(entry)
                 link = entry.get("link") if isinstance(entry, dict) else getattr(entry, "link", "")
-                if not link:
-                    continue
-                if dt is None or dt >= since_utc:
-                    collected.append((str(link), dt))
+                if link:
+                    links.append((str(link), self._best_entry_datetime(entry)))
+
+            if status != 200:
+                return FeedState(etag=None, modified=None, entries=links)
+            return FeedState(
+                etag=response.headers.get("etag"),
+                modified=response.headers.get("last-modified"),
+                entries=links,
+            )
+        return None
 
-        unique: List[Tuple[str, Optional[datetime]]] = []
-        seen = set()
-        for url, dt in collected:
-            if url not in seen:
-                unique.append((url, dt))
-                seen.add(url)
-        return unique
+    async def _collect_feed_urls(
+        self,
+        client: httpx.AsyncClient,
+        source_id: str,
+        urls: Sequence[str],
+        since_utc: datetime,
+        retries: int = 2,
+        log_error: Optional[Callable[[str, Optional[BaseException]], None]] = None,
+        feed_states: Optional[Dict[str, FeedState]] = None,
+    ) -> List[Tuple[str, Optional[datetime]]]:
+        """Robustly collect links from RSS feeds with retries.
+
+        ``feed_states`` maps feed URLs to their stored state and is updated in
+        place with the validators of feeds that answered successfully.
+        """
+
+        states = feed_states if feed_states is not None else {}
+        fetched = await asyncio.gather(
+            *(
+                self._fetch_feed(client, source_id, url, retries, log_error, states.get(url))
+                for url in urls
+            )
+        )
+
+        unique: Dict[str, Optional[datetime]] = {}
+        for feed_url, feed in zip(urls, fetched):
+            if feed is None:
+                continue
+            if feed.etag or feed.modified:
+                states[feed_url] = feed
+            for link, dt in feed.entries:
+                if link not in unique and (dt is None or dt >= since_utc):
+                    unique[link] = dt
+        return list(unique.items())
+
+    async def _collect_sources(
+        self,
+        sources: Sequence[Source],
+        since_utc: datetime,
+        feed_states: Optional[Dict[str, FeedState]] = None,
+    ) -> List[List[Tuple[str, Optional[datetime]]]]:
+        """Collect feed links for every source over one shared keep-alive client."""
+
+        limits = httpx.Limits(max_connections=max(1, self.config.concurrency))
+        async with httpx.AsyncClient(
+            headers={"User-Agent": self.config.user_agent},
+            timeout=max(1, self.config.timeout),
+            limits=limits,
+            follow_redirects=True,
+        ) as client:
+            return await asyncio.gather(
+                *(
+                    self._collect_feed_urls(
+                        client,
+                        src.id,
+                        src.urls,
+                        since_utc,
+                        retries=self.config.feed_retries,
+                        feed_states=feed_states,
+                    )
+                    for src in sources
+                )
+            )
+
+    def _precheck(self, client: httpx.Client, url: str) -> bool:
+        """Reject pages that a HEAD request shows to be gone, non-HTML or oversized.
+
+        Anything short of a definitive answer (errors, timeouts, other statuses)
+        lets the full download decide.
+        """
 
-    @staticmethod
-    def _extract_article(url: str) -> Optional[NewsPlease]:
         try:
-            return NewsPlease.from_url(url)
+            response = client.head(url, timeout=min(_HEAD_TIMEOUT, max(1, self.config.timeout)))
+        except Exception:
+            return True
+        if response.status_code in (404, 410):
+            return False
+        if response.status_code >= 400:
+            return True
+        content_type = response.headers.get("content-type")
+        if content_type and "html" not in content_type.lower():
+            return False
+        try:
+            length = int(response.headers.get("content-length", 0))
+        except ValueError:
+            length = 0
+        return length <= self.config.max_page_bytes
+
+    def _extract_article(self, client: httpx.Client, url: str) -> Optional[NewsPlease]:
+        try:
+            response = client.get(url)
+            if response.status_code >= 400:
+                return None
+            html = response.text
+            # A page shorter than min_chars cannot hold an article body worth
+            # keeping, so skip the extraction and language detection passes.
+            if len(html) < self.config.min_chars:
+                return None
+            return NewsPlease.from_html(html, url=url, download_date=datetime.now())
         except Exception:
             return None
 
@@ -171,8 +365,11 @@ class NewsFetcher:
         source_id: str,
         url: str,
         guess_dt: Optional[datetime],
+        client: httpx.Client,
     ) -> Optional[Article]:
-        art = self._extract_article(url)
+        if self.config.head_check and not self._precheck(client, url):
+            return None
+        art = self._extract_article(client, url)
         if art is None:
             return None
 
@@ -181,8 +378,7 @@ class NewsFetcher:
             return None
 
         title = getattr(art, "title", None)
-        ext = tldextract.extract(url)
-        domain = ".".join(part for part in [ext.domain, ext.suffix] if part)
+        domain = _domain_for_host(urlsplit(url).hostname or "")
 
         published_dt = getattr(art, "date_publish", None)
         if isinstance(published_dt, datetime):
@@ -222,9 +418,7 @@ class NewsFetcher:
         )
 
     def _load_sources(self) -> List[Source]:
-        import json
-
-        raw = json.loads(self.config.sources_path.read_text(encoding="utf-8"))
+        raw = orjson.loads(self.config.sources_path.read_bytes())
         sources: List[Source] = []
         for entry in raw:
             if entry.get("type") != "rss":
@@ -249,17 +443,31 @@ class NewsFetcher:
         socket.setdefaulttimeout(max(1, self.config.timeout))
 
         sources = self._load_sources()
+        cache: Optional[ArticleCache] = None
+        feed_states: Dict[str, FeedState] = {}
+        if self.config.cache_path is not None:
+            cache = ArticleCache(self.config.cache_path)
+            feed_states = cache.get_feeds([url for src in sources for url in src.urls])
+        collected = asyncio.run(self._collect_sources(sources, cutoff, feed_states))
+        if cache is not None and feed_states:
+            cache.put_feeds(feed_states)
+
         all_tasks: List[Tuple[str, str, Optional[datetime]]] = []
-        for src in sources:
-            urls = self._collect_feed_urls(
-                src.id,
-                src.urls,
-                cutoff,
-                request_headers={"User-Agent": self.config.user_agent},
-                retries=self.config.feed_retries,
-            )
+        seen_urls = set()
+        for src, urls in zip(sources, collected):
+            unique = []
+            for url, dt in urls:
+                key = _canonical_url(url)
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
+                unique.append((url, dt))
+            urls = unique
             if self.config.max_per_source and len(urls) > self.config.max_per_source:
                 urls = urls[: self.config.max_per_source]
+            # Tasks are submitted in order, so keeping each host's links adjacent
+            # lets consecutive downloads reuse pooled connections and DNS results.
+            urls.sort(key=lambda item: urlsplit(item[0]).hostname or "")
             for url, dt in urls:
                 all_tasks.append((src.id, url, dt))
 
@@ -270,33 +478,54 @@ class NewsFetcher:
             stage.set_total(len(all_tasks))
 
         results: List[Article] = []
-        lock = Lock()
-
-        def _append(article: Optional[Article]) -> None:
-            if article is None:
-                return
-            with lock:
-                results.append(article)
-
-        with futures.ThreadPoolExecutor(max_workers=self.config.concurrency) as pool:
-            future_to_url = {
-                pool.submit(self._map_article, source_id, url, guess_dt): url
-                for source_id, url, guess_dt in all_tasks
-            }
-            for fut in futures.as_completed(future_to_url):
+
+        if cache is not None:
+            newer_than = start_time - self.parse_since(self.config.cache_max_age)
+            cached = cache.get_many({url: sid for sid, url, _ in all_tasks}, newer_than)
+            if cached:
+                for article in cached.values():
+                    if article.best_timestamp() >= cutoff:
+                        results.append(article)
+                if stage is not None:
+                    stage.advance(len(cached))
+                all_tasks = [task for task in all_tasks if task[1] not in cached]
+        fresh: List[Article] = []
+
+        def _worker(task: Tuple[str, str, Optional[datetime]]) -> Optional[Article]:
+            source_id, url, guess_dt = task
+            return self._map_article(source_id, url, guess_dt, client)
+
+        buffersize = max(32, self.config.concurrency * 4)
+        # One keep-alive client for every article download so repeated hosts
+        # reuse their TCP/TLS connections instead of reconnecting per URL.
+        client = httpx.Client(
+            headers={"User-Agent": self.config.user_agent},
+            timeout=max(1, self.config.timeout),
+            limits=httpx.Limits(
+                max_connections=max(1, self.config.concurrency),
+                max_keepalive_connections=max(1, self.config.concurrency),
+            ),
+            follow_redirects=True,
+            default_encoding=_detect_encoding,
+        )
+        with client, futures.ThreadPoolExecutor(max_workers=self.config.concurrency) as pool:
+            for fut in _bounded_map(pool, _worker, all_tasks, buffersize):
                 try:
                     article = fut.result()
                     if article is None:
                         continue
+                    fresh.append(article)
                     if article.best_timestamp() < cutoff:
                         continue
-                    _append(article)
+                    results.append(article)
                 except Exception:
                     continue
                 finally:
                     if stage is not None:
                         stage.advance(1)
 
+        if cache is not None and fresh:
+            cache.put_many(fresh)
         return results
 
 
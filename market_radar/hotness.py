@@ -6,6 +6,8 @@ import math
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Sequence, TYPE_CHECKING
 
+import numpy as np
+
 from .config import HotnessConfig
 from .models import Article
 
@@ -20,23 +22,41 @@ class HotnessCalculator:
         self.start_time = start_time.astimezone(timezone.utc)
         self.window = window
         self.cutoff = self.start_time - window
+        self._decay = float(config.time_decay)
+        self._tail = math.exp(-self._decay)
+        self._one_minus_tail = 1.0 - self._tail
+        self._window_s = window.total_seconds()
+        self._start_ts = self.start_time.timestamp()
+        self._cutoff_ts = self.cutoff.timestamp()
 
     def time_coef(self, article: Article) -> float:
-        ts = article.best_timestamp().astimezone(timezone.utc)
-        if ts <= self.cutoff:
+        return self._time_coef_ts(article.best_timestamp().timestamp())
+
+    def _time_coef_ts(self, ts: float) -> float:
+        if ts <= self._cutoff_ts:
             return 0.0
-        if ts >= self.start_time:
+        if ts >= self._start_ts or self._window_s <= 0:
             return 1.0
-        elapsed = (self.start_time - ts).total_seconds()
-        window_seconds = self.window.total_seconds()
-        if window_seconds <= 0:
-            return 1.0
-        ratio = min(max(elapsed / window_seconds, 0.0), 1.0)
-        tail = math.exp(-self.config.time_decay)
-        value = math.exp(-self.config.time_decay * ratio)
-        if value <= tail:
+        ratio = min(max((self._start_ts - ts) / self._window_s, 0.0), 1.0)
+        value = math.exp(-self._decay * ratio)
+        if value <= self._tail:
             return 0.0
-        return (value - tail) / (1.0 - tail)
+        return (value - self._tail) / self._one_minus_tail
+
+    def time_coefs(self, timestamps: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`time_coef` over epoch-second timestamps."""
+
+        if self._window_s <= 0:
+            coefs = np.ones_like(timestamps)
+        else:
+            ratio = np.clip((self._start_ts - timestamps) / self._window_s, 0.0, 1.0)
+            value = np.exp(-self._decay * ratio)
+            coefs = np.zeros_like(timestamps)
+            above = value > self._tail
+            coefs[above] = (value[above] - self._tail) / self._one_minus_tail
+            coefs[timestamps >= self._start_ts] = 1.0
+        coefs[timestamps <= self._cutoff_ts] = 0.0
+        return coefs
 
     def apply(
         self,
@@ -44,35 +64,36 @@ class HotnessCalculator:
         stage: Optional["StageHandle"] = None,
     ) -> None:
         weights = self.config.weights
-        scores = []
         if stage is not None:
             stage.set_total(len(articles))
-        for art in articles:
-            art.time_coef = self.time_coef(art)
-            density = art.density_coef or 0.0
-            domain = art.domain_coef or 0.0
-            time_component = art.time_coef or 0.0
-            score = (
-                weights.time * time_component
-                + weights.density * density
-                + weights.domain * domain
-            )
-            art.hotness = score
-            scores.append(score)
-            if stage is not None:
-                stage.advance(1)
-
-        if not scores:
+        if not articles:
             return
 
-        lo = min(scores)
-        hi = max(scores)
-        for art in articles:
-            score = art.hotness or 0.0
-            if hi > lo:
-                art.hotness = (score - lo) / (hi - lo)
-            else:
-                art.hotness = 1.0 if score > 0 else 0.0
+        count = len(articles)
+        timestamps = np.fromiter(
+            (art.best_timestamp().timestamp() for art in articles), dtype=np.float64, count=count
+        )
+        density = np.fromiter(
+            (art.density_coef or 0.0 for art in articles), dtype=np.float64, count=count
+        )
+        domain = np.fromiter(
+            (art.domain_coef or 0.0 for art in articles), dtype=np.float64, count=count
+        )
+
+        time_coefs = self.time_coefs(timestamps)
+        scores = weights.time * time_coefs + weights.density * density + weights.domain * domain
+        lo = scores.min()
+        hi = scores.max()
+        if hi > lo:
+            hotness = (scores - lo) / (hi - lo)
+        else:
+            hotness = (scores > 0).astype(np.float64)
+
+        for art, time_coef, value in zip(articles, time_coefs.tolist(), hotness.tolist()):
+            art.time_coef = time_coef
+            art.hotness = value
+        if stage is not None:
+            stage.advance(count)
 
 
 __all__ = ["HotnessCalculator"]
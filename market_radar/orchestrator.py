@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+import os
+import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
 
+import numpy as np
+import orjson
+
 from .config import PipelineConfig
 from .deduplication import Deduplicator, DeduplicationSettings
 from .density_estimator import DensityEstimator
@@ -25,8 +31,7 @@ class NewsPipelineOrchestrator:
 
     def __init__(self, config: PipelineConfig) -> None:
         self.config = config
-        self.start_time = datetime.now(timezone.utc)
-        self.time_window_delta = NewsFetcher.parse_since(config.time_window.since)
+        self._start_clock()
 
         self.fetcher = NewsFetcher(config.fetcher, config.time_window)
         self.density_estimator = DensityEstimator(config.density)
@@ -36,9 +41,24 @@ class NewsPipelineOrchestrator:
         )
         self.deduplicator = Deduplicator(dedup_settings)
         self.summarizer = Summarizer(config.summarizer)
-        self.hotness = HotnessCalculator(config.hotness, self.start_time, self.time_window_delta)
+
+    def close(self) -> None:
+        """Release worker processes held by the pipeline stages."""
+
+        self.density_estimator.close()
+
+    def _start_clock(self) -> None:
+        """Anchor the time window at the current moment for the next run."""
+
+        self.start_time = datetime.now(timezone.utc)
+        self.time_window_delta = NewsFetcher.parse_since(self.config.time_window.since)
+        self.hotness = HotnessCalculator(
+            self.config.hotness, self.start_time, self.time_window_delta
+        )
 
     def run(self) -> List[Dict[str, object]]:
+        # Re-anchor so a long-lived orchestrator can be run repeatedly.
+        self._start_clock()
         with PipelineProgress() as progress:
             with progress.stage("Fetch") as stage:
                 articles = self.fetcher.fetch(self.start_time, stage=stage)
@@ -89,10 +109,35 @@ class NewsPipelineOrchestrator:
         stage: Optional["StageHandle"] = None,
     ) -> List[Dict[str, object]]:
         def _to_iso(dt: datetime) -> str:
-            return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            d = dt.astimezone(timezone.utc)
+            return (
+                f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+                f"T{d.hour:02d}:{d.minute:02d}:{d.second:02d}Z"
+            )
+
+        # Round every coefficient column in one vectorised call.
+        coefs = np.array(
+            [
+                (art.time_coef, art.density_coef, art.domain_coef, art.hotness)
+                for art in articles
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        coefs = np.round(np.nan_to_num(coefs, nan=0.0), 6).tolist()
+
+        # Rank on (hotness, -position) tuples: no key callback per comparison, and
+        # ties keep input order as the previous stable sort did.
+        ranked = [(row[3], -pos) for pos, row in enumerate(coefs)]
+        limit = self.config.output.limit
+        if limit is not None:
+            ranked = heapq.nlargest(limit, ranked)
+        else:
+            ranked.sort(reverse=True)
 
         payload: List[Dict[str, object]] = []
-        for art in articles:
+        for hotness, neg_pos in ranked:
+            art = articles[-neg_pos]
+            time_coef, density_coef, domain_coef, _ = coefs[-neg_pos]
             published = art.published_at or art.crawled_at
             payload.append(
                 {
@@ -102,28 +147,67 @@ class NewsPipelineOrchestrator:
                     "url": art.url,
                     "title": art.title,
                     "summary": art.summary,
-                    "time_coef": round(float(art.time_coef or 0.0), 6),
-                    "density_coef": round(float(art.density_coef or 0.0), 6),
-                    "domain_coef": round(float(art.domain_coef or 0.0), 6),
-                    "hotness": round(float(art.hotness or 0.0), 6),
+                    "time_coef": time_coef,
+                    "density_coef": density_coef,
+                    "domain_coef": domain_coef,
+                    "hotness": hotness,
                 }
             )
             if stage is not None:
                 stage.advance(1)
+        if stage is not None and len(payload) < len(articles):
+            stage.advance(len(articles) - len(payload))
 
-        payload.sort(key=lambda item: item["hotness"], reverse=True)
         return payload
 
     def _write_output(self, data: Sequence[Dict[str, object]]) -> None:
         path = self.config.output.path
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_atomic(path, orjson.dumps(list(data), option=orjson.OPT_INDENT_2))
+
+
+def _fsync(fd: int) -> None:
+    if sys.platform == "darwin":  # pragma: no cover - macOS only
+        import fcntl
+
+        fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+    else:
+        os.fsync(fd)
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Durably replace ``path`` so readers never observe a partial file."""
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+        try:
+            if hasattr(os, "fchmod"):
+                # mkstemp creates 0600 files; keep the output readable as before.
+                os.fchmod(tmp.fileno(), 0o644)
+            tmp.write(payload)
+            tmp.flush()
+            _fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, path)
+    try:
+        dir_fd = os.open(str(path.parent), os.O_RDONLY)
+    except OSError:  # pragma: no cover - directories cannot be opened on Windows
+        return
+    try:
+        _fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
 def run_from_config(path: Path) -> List[Dict[str, object]]:
     config = PipelineConfig.from_yaml(path)
     orchestrator = NewsPipelineOrchestrator(config)
-    return orchestrator.run()
+    try:
+        return orchestrator.run()
+    finally:
+        orchestrator.close()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Optional
 
 from rich.console import Console
@@ -15,6 +16,12 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
+_FLUSH_EVERY = 32
+_FLUSH_INTERVAL = 0.1
+# Redraws come from Rich's background thread; a low rate keeps the spinner and elapsed
+# time moving during stages that rarely advance without costing much CPU.
+_REFRESH_PER_SECOND = 4
+
 
 @dataclass
 class StageHandle:
@@ -26,6 +33,8 @@ class StageHandle:
     completed: bool = False
     total: Optional[float] = None
     completed_amount: float = 0.0
+    _pending: float = field(default=0.0, repr=False)
+    _last_flush: float = field(default_factory=time.monotonic, repr=False)
 
     def set_total(self, total: Optional[int]) -> None:
         self.total = float(total) if total is not None else None
@@ -35,11 +44,22 @@ class StageHandle:
         if self.completed:
             return
         self.completed_amount += amount
-        self.progress._progress.advance(self.task_id, amount)
+        # Coalesce ticks so per-item loops do not take Rich's lock on every call.
+        self._pending += amount
+        now = time.monotonic()
+        if self._pending >= _FLUSH_EVERY or now - self._last_flush >= _FLUSH_INTERVAL:
+            self._flush(now)
+
+    def _flush(self, now: Optional[float] = None) -> None:
+        if self._pending:
+            self.progress._progress.advance(self.task_id, self._pending)
+            self._pending = 0.0
+        self._last_flush = time.monotonic() if now is None else now
 
     def complete(self) -> None:
         if self.completed:
             return
+        self._flush()
         remaining = 0.0
         if self.total is not None:
             remaining = max(self.total - self.completed_amount, 0.0)
@@ -70,6 +90,7 @@ class PipelineProgress:
             TimeElapsedColumn(),
             console=self.console,
             transient=False,
+            refresh_per_second=_REFRESH_PER_SECOND,
         )
         self._pipeline_task: Optional[TaskID] = None
         self._active_stage: Optional[StageHandle] = None
@@ -104,6 +125,7 @@ class PipelineProgress:
             total=float(total) if total is not None else None,
         )
         self._active_stage = handle
+        self._progress.refresh()
         return handle
 
     def _on_stage_complete(self) -> None:
@@ -113,6 +135,7 @@ class PipelineProgress:
             if self._completed_stages >= self._total_stages:
                 self._progress.update(self._pipeline_task, description="Pipeline • done")
         self._active_stage = None
+        self._progress.refresh()
 
 
 __all__ = ["PipelineProgress", "StageHandle"]
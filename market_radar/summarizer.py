@@ -2,19 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import random
 import re
 import time
-from typing import Dict, Optional, Sequence, Tuple, TYPE_CHECKING
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 import httpx
+import orjson
 
 from .config import SummarizerConfig
 from .models import Article
+from .summary_cache import SummaryCache
 
 if TYPE_CHECKING:
     from .progress import StageHandle
 
+API_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE = 1.5
+_BACKOFF_CAP = 30.0
+_RETRY_AFTER_CAP = 60.0
+_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
 CATS: Dict[str, float] = {
     "регуляторика/санкции/правовые риски": 1.0,
     "взломы/инциденты/остановки": 0.9,
@@ -37,8 +50,64 @@ SYSTEM_PROMPT = (
     "маркетинг/«шум»"
 )
 
+BATCH_SYSTEM_PROMPT = (
+    "Ты — финансовый аналитик. Тебе дано несколько новостей, каждая начинается со строки "
+    "«=== ITEM <номер> ===». Суммаризируй каждую по-русски и отнеси её к одной из 5 категорий.\n"
+    "Для КАЖДОЙ новости ответь РОВНО ТРЕМЯ СТРОКАМИ, без пояснений и кода, в исходном порядке:\n"
+    "ITEM=<номер новости>\n"
+    "CATEGORY=<ОДНА категория из списка ниже, БЕЗ изменений формулировки>\n"
+    "SUMMARY=<1–3 коротких предложения с выводом/прогнозом>\n\n"
+    "Категории:\n"
+    "регуляторика/санкции/правовые риски\n"
+    "взломы/инциденты/остановки\n"
+    "существенные тех. прорывы/SOTA\n"
+    "крупные релизы/партнёрства/финансы\n"
+    "маркетинг/«шум»"
+)
+
+# Keyword fallback for categories the model paraphrased; groups are listed in priority order.
+HEUR_RE = re.compile(
+    r"(?P<reg>регулятор|санкц|правов)"
+    r"|(?P<hack>взлом|инцидент|останов|outage|даунтайм)"
+    r"|(?P<sota>sota|прорыв|бенчмарк)"
+    r"|(?P<rel>релиз|партн|финанс|m&a)"
+)
+HEUR_CATEGORIES = {
+    "reg": "регуляторика/санкции/правовые риски",
+    "hack": "взломы/инциденты/остановки",
+    "sota": "существенные тех. прорывы/SOTA",
+    "rel": "крупные релизы/партнёрства/финансы",
+}
+
+ITEM_RE = re.compile(r"^\s*ITEM\s*=\s*(\d+)\s*$", re.IGNORECASE | re.MULTILINE)
 CATEGORY_RE = re.compile(r"^\s*CATEGORY\s*=\s*(.+?)\s*$", re.IGNORECASE | re.MULTILINE)
 SUMMARY_RE = re.compile(r"^\s*SUMMARY\s*=\s*(.+?)\s*$", re.IGNORECASE | re.MULTILINE)
+# A streamed answer line is only final once its newline has arrived.
+CATEGORY_DONE_RE = re.compile(r"^\s*CATEGORY\s*=.*\S.*\n", re.IGNORECASE | re.MULTILINE)
+SUMMARY_DONE_RE = re.compile(r"^\s*SUMMARY\s*=.*\S.*\n", re.IGNORECASE | re.MULTILINE)
+
+
+class _TokenBucket:
+    """Async token bucket keeping requests within a per-minute budget."""
+
+    def __init__(self, per_minute: int, burst: int) -> None:
+        self.rate = per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, _request: Optional[httpx.Request] = None) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
 
 
 class Summarizer:
@@ -47,6 +116,19 @@ class Summarizer:
     def __init__(self, config: SummarizerConfig) -> None:
         self.config = config
         self.api_key = config.api_key or os.getenv("OPENROUTER_API_KEY")
+        self._cache: Optional[SummaryCache] = None
+
+    def _ensure_cache(self) -> Optional[SummaryCache]:
+        if not self.config.cache_path:
+            return None
+        # Prompts and sampling settings are part of the key so editing them invalidates old
+        # entries; batched runs also answer with BATCH_SYSTEM_PROMPT, so they get their own keys.
+        namespace = f"{self.config.model}\0{self.config.temperature}\0{SYSTEM_PROMPT}"
+        if self.config.batch_size > 1:
+            namespace = f"{namespace}\0batch\0{BATCH_SYSTEM_PROMPT}"
+        if self._cache is None or self._cache.namespace != namespace:
+            self._cache = SummaryCache(Path(self.config.cache_path), namespace)
+        return self._cache
 
     def _parse_model_output(self, text: str) -> Tuple[str, str]:
         cat_match = CATEGORY_RE.search(text)
@@ -57,50 +139,143 @@ class Summarizer:
         if raw_cat in CAT_KEYS:
             category = CAT_KEYS[raw_cat]
         else:
-            lr = raw_cat
-            if any(w in lr for w in ["регулятор", "санкц", "правов"]):
-                category = "регуляторика/санкции/правовые риски"
-            elif any(w in lr for w in ["взлом", "инцидент", "останов", "outage", "даунтайм"]):
-                category = "взломы/инциденты/остановки"
-            elif any(w in lr for w in ["sota", "прорыв", "бенчмарк"]):
-                category = "существенные тех. прорывы/SOTA"
-            elif any(w in lr for w in ["релиз", "партнер", "партн", "финанс", "m&a"]):
-                category = "крупные релизы/партнёрства/финансы"
-            else:
-                category = "маркетинг/«шум»"
+            found = {match.lastgroup for match in HEUR_RE.finditer(raw_cat)}
+            category = next(
+                (HEUR_CATEGORIES[group] for group in HEUR_CATEGORIES if group in found),
+                "маркетинг/«шум»",
+            )
 
         if not summary:
             summary = "Саммари не извлечено: модель вернула нестандартный формат ответа."
         return category, summary
 
-    def _call_llm(self, title: str, content: str) -> Tuple[str, str]:
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+    def _parse_batched_output(self, text: str) -> Dict[int, Tuple[str, str]]:
+        """Split a batched reply into per-item ``(category, summary)`` pairs.
+
+        Items whose block lacks a CATEGORY or SUMMARY line are left out so the
+        caller can retry them individually.
+        """
+
+        parsed: Dict[int, Tuple[str, str]] = {}
+        markers = list(ITEM_RE.finditer(text))
+        for pos, marker in enumerate(markers):
+            end = markers[pos + 1].start() if pos + 1 < len(markers) else len(text)
+            block = text[marker.end() : end]
+            if CATEGORY_RE.search(block) and SUMMARY_RE.search(block):
+                parsed[int(marker.group(1))] = self._parse_model_output(block)
+        return parsed
+
+    async def _complete(
+        self,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_message: str,
+        is_done: Optional[Callable[[str], bool]] = None,
+    ) -> str:
         payload = {
             "model": self.config.model,
             "messages": [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": f"Заголовок: {title}\n\nТекст:\n{content or '(пусто)'}"},
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
             ],
             "temperature": self.config.temperature,
         }
+        if self.config.stream:
+            payload["stream"] = True
 
-        backoffs = [0, 1.5, 3.0]
         last_err: Optional[Exception] = None
-        with httpx.Client(timeout=self.config.timeout) as client:
-            for wait in backoffs:
-                try:
-                    if wait:
-                        time.sleep(wait)
-                    response = client.post(
-                        "https://openrouter.ai/api/v1/chat/completions", headers=headers, json=payload
-                    )
-                    response.raise_for_status()
-                    text = response.json()["choices"][0]["message"]["content"]
-                    return self._parse_model_output(text)
-                except Exception as exc:  # pragma: no cover - network errors
-                    last_err = exc
+        for attempt in range(_MAX_ATTEMPTS):
+            response: Optional[httpx.Response] = None
+            try:
+                # Malformed bodies are not transient, so they propagate without a retry.
+                if self.config.stream:
+                    return await self._post_streaming(client, payload, is_done)
+                response = await client.post(API_URL, json=payload)
+                response.raise_for_status()
+                return orjson.loads(response.content)["choices"][0]["message"]["content"]
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code not in _RETRY_STATUSES:
+                    raise
+                last_err = exc
+                response = exc.response
+            except httpx.TransportError as exc:  # pragma: no cover - network errors
+                last_err = exc
+            if attempt + 1 < _MAX_ATTEMPTS:
+                await asyncio.sleep(self._retry_delay(attempt, response))
         raise RuntimeError(f"LLM call failed after retries: {last_err}")
 
+    async def _post_streaming(
+        self,
+        client: httpx.AsyncClient,
+        payload: Dict[str, object],
+        is_done: Optional[Callable[[str], bool]],
+    ) -> str:
+        """Accumulate an SSE completion, hanging up once ``is_done`` accepts the text."""
+
+        parts: List[str] = []
+        async with client.stream("POST", API_URL, json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                # Blank separators and ": keep-alive" comments carry no data.
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                chunk = orjson.loads(data)
+                if "error" in chunk:
+                    raise ValueError(f"LLM stream error: {chunk['error']}")
+                delta = chunk["choices"][0].get("delta", {}).get("content") or ""
+                parts.append(delta)
+                # Lines only complete on a newline, so only then is an early exit possible.
+                if is_done is not None and "\n" in delta and is_done("".join(parts)):
+                    break
+        return "".join(parts)
+
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+        """Exponential backoff with jitter, deferring to ``Retry-After`` when throttled."""
+
+        delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt) * random.uniform(0.5, 1.5)
+        if response is not None and response.status_code == 429:
+            try:
+                return min(_RETRY_AFTER_CAP, max(0.0, float(response.headers["Retry-After"])))
+            except (KeyError, ValueError):
+                pass
+        return delay
+
+    @staticmethod
+    def _answer_complete(text: str) -> bool:
+        return bool(CATEGORY_DONE_RE.search(text) and SUMMARY_DONE_RE.search(text))
+
+    @staticmethod
+    def _user_message(title: str, content: str) -> str:
+        return f"Заголовок: {title}\n\nТекст:\n{content or '(пусто)'}"
+
+    async def _call_llm(
+        self,
+        client: httpx.AsyncClient,
+        title: str,
+        content: str,
+    ) -> Tuple[str, str]:
+        text = await self._complete(
+            client, SYSTEM_PROMPT, self._user_message(title, content), self._answer_complete
+        )
+        return self._parse_model_output(text)
+
+    async def _call_llm_batch(
+        self,
+        client: httpx.AsyncClient,
+        articles: Sequence[Article],
+    ) -> Dict[int, Tuple[str, str]]:
+        blocks = [
+            f"=== ITEM {pos} ===\n{self._user_message(art.title or '', art.content or '')}"
+            for pos, art in enumerate(articles, start=1)
+        ]
+        text = await self._complete(client, BATCH_SYSTEM_PROMPT, "\n\n".join(blocks))
+        parsed = self._parse_batched_output(text)
+        return {pos - 1: parsed[pos] for pos in range(1, len(articles) + 1) if pos in parsed}
+
     def _fallback(self, title: str, content: str) -> Tuple[str, str]:
         if title:
             summary = title
@@ -110,23 +285,127 @@ class Summarizer:
             summary = "Нет данных для саммари."
         return "маркетинг/«шум»", summary
 
-    def summarize_article(self, article: Article) -> Tuple[str, float]:
-        title = article.title or ""
-        content = article.content or ""
-        if not self.api_key:
-            category, summary = self._fallback(title, content)
-        else:
-            try:
-                category, summary = self._call_llm(title, content)
-            except Exception:
-                if not self.config.fallback_summary:
-                    raise
-                category, summary = self._fallback(title, content)
+    def _apply(self, article: Article, category: str, summary: str) -> Tuple[str, float]:
         weight = CATS.get(category, min(CATS.values()))
         article.summary = summary
         article.domain_coef = weight
         return category, weight
 
+    async def _summarize_all(
+        self,
+        articles: Sequence[Article],
+        stage: Optional["StageHandle"] = None,
+    ) -> List[Tuple[str, float]]:
+        results: Dict[int, Tuple[str, float]] = {}
+        pending = list(range(len(articles)))
+        cache = self._ensure_cache()
+        fresh: List[Tuple[str, str, str, str]] = []
+        texts = [(art.title or "", art.content or "") for art in articles]
+
+        if cache is not None:
+            hits = cache.get_many(texts)
+            for idx, text in enumerate(texts):
+                if text in hits:
+                    results[idx] = self._apply(articles[idx], *hits[text])
+            pending = [idx for idx in pending if idx not in results]
+            if stage is not None and results:
+                stage.advance(len(results))
+
+        # Syndicated copies share title and text; ask the model once per distinct pair.
+        copies: Dict[int, List[int]] = {}
+        first: Dict[Tuple[str, str], int] = {}
+        for idx in pending:
+            rep = first.setdefault(texts[idx], idx)
+            if rep != idx:
+                copies.setdefault(rep, []).append(idx)
+        pending = list(first.values())
+
+        def _done(idx: int, category: str, summary: str) -> None:
+            article = articles[idx]
+            results[idx] = self._apply(article, category, summary)
+            fresh.append((article.title or "", article.content or "", category, summary))
+            if cache is not None and len(fresh) >= max(1, self.config.cache_flush_every):
+                # Persist as we go so a crashed run resumes from the cache instead of re-billing.
+                cache.put_many(fresh)
+                fresh.clear()
+            if stage is not None:
+                stage.advance(1)
+
+        concurrency = max(1, self.config.concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+        hooks = {}
+        if self.config.rpm:
+            # Every attempt, retries included, draws a token before it is sent.
+            bucket = _TokenBucket(self.config.rpm, burst=min(self.config.rpm, concurrency))
+            hooks["request"] = [bucket.acquire]
+        # One client per run: the pool and credentials are reused by every request.
+        async with httpx.AsyncClient(
+            timeout=self.config.timeout,
+            limits=limits,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            event_hooks=hooks,
+        ) as client:
+
+            async def _one(idx: int) -> None:
+                title = articles[idx].title or ""
+                content = articles[idx].content or ""
+                try:
+                    async with semaphore:
+                        category, summary = await self._call_llm(client, title, content)
+                except Exception:
+                    if not self.config.fallback_summary:
+                        raise
+                    # Fallbacks are not cached so a later run asks the model again.
+                    results[idx] = self._apply(articles[idx], *self._fallback(title, content))
+                    if stage is not None:
+                        stage.advance(1)
+                    return
+                _done(idx, category, summary)
+
+            async def _batch(batch: Sequence[int]) -> None:
+                try:
+                    async with semaphore:
+                        parsed = await self._call_llm_batch(client, [articles[i] for i in batch])
+                except Exception:
+                    parsed = {}
+                for pos, idx in enumerate(batch):
+                    if pos in parsed:
+                        _done(idx, *parsed[pos])
+                    else:
+                        # Items missing from the batched reply are retried on their own.
+                        await _one(idx)
+
+            batch_size = max(1, self.config.batch_size)
+            try:
+                if batch_size == 1:
+                    await asyncio.gather(*(_one(idx) for idx in pending))
+                else:
+                    await asyncio.gather(
+                        *(
+                            _batch(pending[start : start + batch_size])
+                            for start in range(0, len(pending), batch_size)
+                        )
+                    )
+            finally:
+                if cache is not None and fresh:
+                    cache.put_many(fresh)
+
+        for rep, dups in copies.items():
+            for idx in dups:
+                results[idx] = self._apply(articles[idx], results[rep][0], articles[rep].summary or "")
+            if stage is not None:
+                stage.advance(len(dups))
+
+        return [results[idx] for idx in range(len(articles))]
+
+    def summarize_article(self, article: Article) -> Tuple[str, float]:
+        if not self.api_key:
+            return self._apply(article, *self._fallback(article.title or "", article.content or ""))
+        return asyncio.run(self._summarize_all([article]))[0]
+
     def summarize(
         self,
         articles: Sequence[Article],
@@ -134,10 +413,14 @@ class Summarizer:
     ) -> None:
         if stage is not None:
             stage.set_total(len(articles))
-        for article in articles:
-            self.summarize_article(article)
+        if not self.api_key:
+            for article in articles:
+                self._apply(article, *self._fallback(article.title or "", article.content or ""))
             if stage is not None:
-                stage.advance(1)
+                stage.advance(len(articles))
+            return
+        if articles:
+            asyncio.run(self._summarize_all(articles, stage))
 
 
 __all__ = ["Summarizer"]
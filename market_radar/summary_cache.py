@@ -0,0 +1,72 @@
+"""Persistent cache of LLM summaries for the Market Radar summarizer."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Sequence, Tuple
+
+_LOOKUP_CHUNK = 500
+
+TextPair = Tuple[str, str]
+
+
+class SummaryCache:
+    """Store ``(category, summary)`` results in SQLite keyed by a hash of prompt and text."""
+
+    def __init__(self, path: Path, namespace: str) -> None:
+        self.path = path
+        self.namespace = namespace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries(key BLOB PRIMARY KEY, category TEXT, summary TEXT)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _key(self, title: str, content: str) -> bytes:
+        payload = f"{self.namespace}\0{title}\0{content}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get_many(self, items: Sequence[TextPair]) -> Dict[TextPair, TextPair]:
+        """Return cached results for the ``(title, content)`` pairs that are present."""
+
+        keys = {self._key(title, content): (title, content) for title, content in items}
+        found: Dict[TextPair, TextPair] = {}
+        key_list = list(keys)
+        with self._connect() as conn:
+            for start in range(0, len(key_list), _LOOKUP_CHUNK):
+                chunk = key_list[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, category, summary FROM summaries WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                for key, category, summary in rows:
+                    found[keys[key]] = (category, summary)
+        return found
+
+    def put_many(self, results: Sequence[Tuple[str, str, str, str]]) -> None:
+        """Persist ``(title, content, category, summary)`` rows."""
+
+        rows = [
+            (self._key(title, content), category, summary)
+            for title, content, category, summary in results
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO summaries(key, category, summary) VALUES (?, ?, ?)", rows
+            )
+
+
+__all__ = ["SummaryCache"]